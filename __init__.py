@@ -1,11 +1,185 @@
 import bpy
 import math
+import sys
 import time
-from mathutils import Vector
+from mathutils import Matrix, Quaternion, Vector
 from bpy_extras import view3d_utils
-from bpy.props import FloatProperty, BoolProperty
+from bpy.props import FloatProperty, BoolProperty, IntProperty
 from bpy.types import AddonPreferences
 
+# Optional: compile the scalar camera math with numba when it is installed
+# in Blender's Python. Everything works the same without it.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Bound once at import so the per-frame camera update skips the module lookup
+_sin = math.sin
+_cos = math.cos
+_sqrt = math.sqrt
+_atan2 = math.atan2
+_acos = math.acos
+_perf = time.perf_counter
+
+# Angle constants
+_PI = math.pi
+_PI_OVER_2 = math.pi * 0.5
+_PI_OVER_4 = math.pi * 0.25
+_DEG2RAD = math.pi / 180.0
+
+# Relative tolerance below which a camera change is treated as no change
+_EPSILON = sys.float_info.epsilon
+
+# Resolution of the transition easing lookup table
+_EASE_STEPS = 64
+
+
+def _ease_in_out(progress):
+    """Quadratic ease-in-out for a progress value in [0, 1]."""
+    if progress < 0.5:
+        return 2.0 * progress * progress
+    t = -2.0 * progress + 2.0
+    return 1.0 - t * t * 0.5
+
+
+# Eased progress sampled at _EASE_STEPS + 1 evenly spaced points
+_EASE_LUT = tuple(_ease_in_out(i / _EASE_STEPS) for i in range(_EASE_STEPS + 1))
+
+
+def _eased_progress(progress):
+    """Return _ease_in_out(progress), interpolated from the lookup table."""
+    scaled = progress * _EASE_STEPS
+    idx = int(scaled)
+    if idx >= _EASE_STEPS:
+        return 1.0
+    lo = _EASE_LUT[idx]
+    return lo + (_EASE_LUT[idx + 1] - lo) * (scaled - idx)
+
+
+def _spherical_to_cart(tx, ty, tz, r, phi, theta):
+    """Return the point at spherical (r, phi, theta) around (tx, ty, tz), Z-up."""
+    rs = r * _sin(phi)
+    return (
+        tx + rs * _cos(theta),
+        ty + rs * _sin(theta),
+        tz + r * _cos(phi),
+    )
+
+
+def _look_at_from_spherical(phi, theta):
+    """Return (w, x, y, z) of the rotation looking at the orbit center.
+
+    This is Rz(theta + pi/2) @ Rx(phi) expanded from the half angles: tilt
+    the view down from the zenith by phi, then turn it to face back along
+    theta. Matches direction.to_track_quat('-Z', 'Y').
+    """
+    a = (theta + _PI_OVER_2) * 0.5
+    b = phi * 0.5
+    ca = _cos(a)
+    sa = _sin(a)
+    cb = _cos(b)
+    sb = _sin(b)
+    return ca * cb, ca * sb, sa * sb, sa * cb
+
+
+def _cart_to_spherical(dx, dy, dz):
+    """Return (r, phi, theta) for an offset vector; angles are 0 when r is 0."""
+    r2 = dx * dx + dy * dy + dz * dz
+    if r2 == 0.0:
+        return 0.0, 0.0, 0.0
+    r = _sqrt(r2)
+    # atan2 is scale-invariant, so only the z component needs normalizing
+    cz = dz / r
+    if cz > 1.0:
+        cz = 1.0
+    elif cz < -1.0:
+        cz = -1.0
+    return r, _acos(cz), _atan2(dy, dx)
+
+
+if numba is not None:
+    # Explicit signatures compile (or load from cache) while the addon loads,
+    # instead of stalling the first drag or transition tick.
+    _eased_progress = numba.njit("f8(f8)", cache=True)(_eased_progress)
+    _spherical_to_cart = numba.njit(
+        "UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8)", cache=True)(_spherical_to_cart)
+    _look_at_from_spherical = numba.njit(
+        "UniTuple(f8, 4)(f8, f8)", cache=True)(_look_at_from_spherical)
+    _cart_to_spherical = numba.njit(
+        "UniTuple(f8, 3)(f8, f8, f8)", cache=True)(_cart_to_spherical)
+
+
+def _onlerp_coefficients(q0, q1):
+    """Return (a, b, sign) for _onlerp() between two unit quaternions.
+
+    These only depend on the end points, so they are computed once per
+    transition. Fitted coefficients from Arseny Kapoulkine's "Approximating
+    slerp" (optimized nlerp).
+    """
+    dot = q0.dot(q1)
+    d = abs(dot)
+    a = 1.0904 + d * (-3.2452 + d * (3.55645 - d * 1.43519))
+    b = 0.848013 + d * (-1.06021 + d * 0.215638)
+    return a, b, (1.0 if dot > 0.0 else -1.0)
+
+
+def _onlerp(q0, q1, t, a, b, sign):
+    """Approximate q0.slerp(q1, t) with a corrected, normalized lerp.
+
+    Avoids the acos/sin of a true slerp; the error stays below 0.1 degrees.
+    """
+    u = t - 0.5
+    ot = t + t * u * (t - 1.0) * (a * u * u + b)
+    lt = 1.0 - ot
+    rt = ot * sign
+    q = Quaternion((
+        q0.w * lt + q1.w * rt,
+        q0.x * lt + q1.x * rt,
+        q0.y * lt + q1.y * rt,
+        q0.z * lt + q1.z * rt,
+    ))
+    q.normalize()
+    return q
+
+
+def _look_at_quaternion(eye, target):
+    """Rotation pointing -Z from eye towards target, keeping Y upright.
+
+    Same result as (target - eye).to_track_quat('-Z', 'Y'), but builds the
+    basis from the forward vector and world up directly.
+    """
+    fx = target.x - eye.x
+    fy = target.y - eye.y
+    fz = target.z - eye.z
+    flen2 = fx * fx + fy * fy + fz * fz
+    # Looking straight up/down (or at the eye itself) has no defined right
+    # vector; leave those to the general-purpose path.
+    if fx * fx + fy * fy <= 1e-12 * flen2 or flen2 == 0.0:
+        return Vector((fx, fy, fz)).to_track_quat('-Z', 'Y')
+
+    inv = 1.0 / math.sqrt(flen2)
+    fx *= inv
+    fy *= inv
+    fz *= inv
+
+    # right = forward x world_up, normalized; it is always horizontal
+    inv = 1.0 / math.sqrt(fx * fx + fy * fy)
+    rx = fy * inv
+    ry = -fx * inv
+
+    # up = right x forward
+    ux = ry * fz
+    uy = -rx * fz
+    uz = rx * fy - ry * fx
+
+    return Matrix((
+        (rx, ux, -fx),
+        (ry, uy, -fy),
+        (0.0, uz, -fz),
+    )).to_quaternion()
+
+
 class SLCameraPreferences(AddonPreferences):
     bl_idname = __package__
     
@@ -74,6 +248,20 @@ class SLCameraPreferences(AddonPreferences):
         max=89.0,
         precision=1
     )
+
+    coalesce_mouse_motion: BoolProperty(
+        name="Coalesce Mouse Motion",
+        description="Apply mouse movement once per viewport update instead of on every mouse event (disable for low polling rate mice)",
+        default=True
+    )
+
+    drag_threshold: IntProperty(
+        name="Drag Threshold",
+        description="Mouse movement in pixels needed before a drag moves the camera (higher values filter out sensor jitter)",
+        default=1,
+        min=1,
+        max=10
+    )
     
     def draw(self, context):
         layout = self.layout
@@ -95,6 +283,11 @@ class SLCameraPreferences(AddonPreferences):
         col.prop(self, "max_zoom_distance")
         col.prop(self, "orbit_elevation_limit")
 
+        col.separator()
+        col.label(text="Performance:")
+        col.prop(self, "coalesce_mouse_motion")
+        col.prop(self, "drag_threshold")
+
 class SL_CAMERA_OT_modal(bpy.types.Operator):
     bl_idname = "view3d.sl_camera_modal"
     bl_label = "SL-Style Camera Control"
@@ -111,75 +304,149 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         default='FOCUS'
     )
     
+    # Camera mode for each modifier combination while Alt is held, indexed by
+    # (ctrl << 1) | shift
+    _MODE_TABLE = (
+        'FOCUS',                     # Alt
+        'FOCUS',                     # Alt + Shift
+        'ORBIT',                     # Alt + Ctrl
+        'PAN',                       # Alt + Ctrl + Shift
+    )
+    
     # Spherical coordinate state
     target_point = None  # Vector - the point we're looking at/orbiting around
-    phi = math.pi / 4    # float - vertical angle from Y-axis (polar angle)
-    theta = math.pi / 4  # float - horizontal angle in X-Z plane (azimuthal angle)
-    distance = 14.0      # float - distance from target point
+    # Packed as [phi, theta, distance] so the drag path can read and write all
+    # three through a single attribute lookup; set up in invoke().
+    #   phi      - float - vertical angle from Z-axis (polar angle)
+    #   theta    - float - horizontal angle in X-Y plane (azimuthal angle)
+    #   distance - float - distance from target point
+    _sph = None
+
+    @property
+    def phi(self):
+        return self._sph[0]
+
+    @phi.setter
+    def phi(self, value):
+        self._sph[0] = value
+
+    @property
+    def theta(self):
+        return self._sph[1]
+
+    @theta.setter
+    def theta(self, value):
+        self._sph[1] = value
+
+    @property
+    def distance(self):
+        return self._sph[2]
+
+    @distance.setter
+    def distance(self, value):
+        self._sph[2] = value
 
     # Transition state
     is_transitioning = False
     start_rotation = None
     end_rotation = None
     transition_start_time = 0
-    transition_duration = 150  # milliseconds
+    transition_duration = 0.15  # seconds
     start_target = None
     end_target = None
     initial_cam_pos = None
     
-    # Timer for animation
+    # Timer for animation, only running while a transition or a coalesced
+    # drag needs it
     _timer = None
 
     def _apply_camera_transform(self, context, position, rotation):
         """Update the scene camera's world transform (used in camera-lock mode)."""
-        camera = context.scene.camera
+        camera = self._camera
         if not camera:
             return
         mat = rotation.to_matrix().to_4x4()
         mat.translation = position
         camera.matrix_world = mat
+        # The matrix we just wrote is the new camera-to-world matrix
+        self._view_inv = mat
 
     def _get_camera_matrix(self, context):
-        """Return the camera-to-world matrix for the current view."""
-        if self.camera_lock_mode and context.scene.camera:
-            return context.scene.camera.matrix_world.copy()
-        return context.space_data.region_3d.view_matrix.inverted()
+        """Return the camera-to-world matrix for the current view.
+
+        The matrix is cached until the operator next changes the view. It is
+        shared between callers and must not be modified in place.
+        """
+        view_inv = self._view_inv
+        if view_inv is None:
+            if self.camera_lock_mode:
+                view_inv = self._camera.matrix_world.copy()
+            else:
+                view_inv = self._rv3d.view_matrix.inverted()
+            self._view_inv = view_inv
+        return view_inv
 
     def _direction_to_spherical(self, direction, default_theta=None, default_phi=None):
         """Update spherical angles from a direction vector."""
-        if direction.length > 0:
-            normalized = direction.normalized()
-            self.theta = math.atan2(normalized.y, normalized.x)
-            self.phi = math.acos(max(-1, min(1, normalized.z)))
+        r, phi, theta = _cart_to_spherical(direction.x, direction.y, direction.z)
+        if r > 0.0:
+            self.theta = theta
+            self.phi = phi
             return
         if default_theta is not None:
             self.theta = default_theta
         if default_phi is not None:
             self.phi = default_phi
 
-    def _update_camera_position(self, context):
-        """Convert spherical coordinates to camera position and update the view."""
+    def _update_camera_position(self, context, _spherical_to_cart=_spherical_to_cart,
+                                _look_at_from_spherical=_look_at_from_spherical,
+                                _Quaternion=Quaternion):
+        """Convert spherical coordinates to camera position and update the view.
+
+        The keyword defaults bind hot globals as fast locals; don't pass them.
+        """
         if not self.target_point:
             return
         
-        # Convert spherical coordinates to Cartesian for Z-up system
-        x = self.target_point.x + self.distance * math.sin(self.phi) * math.cos(self.theta)
-        y = self.target_point.y + self.distance * math.sin(self.phi) * math.sin(self.theta)
-        z = self.target_point.z + self.distance * math.cos(self.phi)
+        tp = self.target_point
+        phi, theta, distance = self._sph
         
-        camera_pos = Vector((x, y, z))
-        
-        # Calculate rotation to look at target
-        direction = (self.target_point - camera_pos).normalized()
-        look_at_rotation = direction.to_track_quat('-Z', 'Y')
+        # Rotation to look at target, built straight from the angles
+        look_at_rotation = _Quaternion(_look_at_from_spherical(phi, theta))
         
         if self.camera_lock_mode:
+            # Convert spherical coordinates to Cartesian for Z-up system.
+            # The viewport only needs the target, rotation and distance.
+            camera_pos = self._scratch_pos
+            camera_pos.x, camera_pos.y, camera_pos.z = _spherical_to_cart(
+                tp.x, tp.y, tp.z, distance, phi, theta)
             self._apply_camera_transform(context, camera_pos, look_at_rotation)
         else:
-            rv3d = context.space_data.region_3d
+            rv3d = self._rv3d
             rv3d.view_location = self.target_point
             rv3d.view_rotation = look_at_rotation
-            rv3d.view_distance = self.distance
+            rv3d.view_distance = distance
+            self._view_inv = None
+        self._pan_basis = None
+
+    def _cache_prefs(self):
+        """Snapshot preferences into plain attributes.
+
+        RNA property access is comparatively slow and the drag handlers run on
+        every mouse move, so they read these copies instead of self.prefs.
+        """
+        prefs = self.prefs
+        self._pan_sens = prefs.pan_sensitivity
+        self._zoom_sens = prefs.zoom_sensitivity
+        self._orbit_sens = prefs.orbit_sensitivity
+        self._inv_h = prefs.invert_horizontal
+        self._inv_v = prefs.invert_vertical
+        self._min_d = prefs.min_zoom_distance
+        self._max_d = prefs.max_zoom_distance
+        self._min_phi = (90.0 - prefs.orbit_elevation_limit) * _DEG2RAD
+        self._max_phi = _PI - self._min_phi
+        self._coalesce = prefs.coalesce_mouse_motion
+        self._drag_threshold_sq = prefs.drag_threshold * prefs.drag_threshold
 
     def invoke(self, context, event):
         if context.area.type != 'VIEW_3D':
@@ -187,6 +454,7 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
             
         # Use the mode from the property (set by keymap)
         self.mode = self.camera_mode
+        self._last_mods = None
 
         # CLICK_DRAG: mouse is held, user is already dragging.
         # CLICK: mouse was pressed and released without dragging.
@@ -210,18 +478,31 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
             context.space_data.lock_camera and
             context.scene.camera is not None
         )
+
+        # Keep direct references to the view, camera and raycast inputs so
+        # per-event handlers don't re-resolve them through the context every
+        # time. None of these change while the blocking modal is running.
+        self._rv3d = rv3d
+        self._region = context.region
+        self._scene = context.scene
+        self._depsgraph = context.view_layer.depsgraph
+        self._camera = context.scene.camera if self.camera_lock_mode else None
+        # Cached camera-to-world matrix, see _get_camera_matrix()
+        self._view_inv = None
+        # Cached pan right/up axes, see _handle_pan_drag()
+        self._pan_basis = None
         
         self.target_point = rv3d.view_location.copy()
-        self.distance = rv3d.view_distance
+        self._sph = [_PI_OVER_4, _PI_OVER_4, rv3d.view_distance]
         
         # Calculate current phi and theta from camera position.
+        # view_mat is never modified in place, so its translation can be read directly
         view_mat = self._get_camera_matrix(context)
-        cam_pos = view_mat.translation.copy()
-        direction = cam_pos - self.target_point
+        direction = view_mat.translation - self.target_point
         self._direction_to_spherical(
             direction,
-            default_theta=math.pi / 4,
-            default_phi=math.pi / 4,
+            default_theta=_PI_OVER_4,
+            default_phi=_PI_OVER_4,
         )
         
         # Transition state
@@ -231,13 +512,24 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         
         # Get addon preferences
         self.prefs = context.preferences.addons[__package__].preferences
-        
-        # Setup timer for animation
-        self._timer = context.window_manager.event_timer_add(0.016, window=context.window)  # ~60fps
+        self._cache_prefs()
+
+        # Scratch vectors reused by the drag handlers to avoid per-event allocations
+        self._scratch_pos = Vector()
+        self._scratch_pan = Vector()
+
+        # Set when the view changed and a redraw is due on the next timer tick
+        self._dirty = False
+
+        # Mouse movement accumulated since the last drag update
+        self._pending_dx = 0
+        self._pending_dy = 0
         
         # Handle the initial click based on mode and update status.
         # For CLICK_DRAG, raycast from the original press position.
         if is_drag:
+            if self._coalesce:
+                self._ensure_timer(context)
             self._handle_click(context, event, coord_override=(self.last_x, self.last_y))
         else:
             self._handle_click(context, event)
@@ -247,38 +539,50 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         return {'RUNNING_MODAL'}
     
     def modal(self, context, event):
-        if context.area is None or context.area.type != 'VIEW_3D':
+        area = context.area
+        if area is None or area.type != 'VIEW_3D':
             return self.finish(context)
         
         # Handle timer for smooth interpolation
         if event.type == 'TIMER':
             if self.is_transitioning:
                 self._update_transition(context)
-                context.area.tag_redraw()
+            elif self._pending_dx or self._pending_dy:
+                self._apply_pending_drag(context)
+            # Tag a single redraw for everything that changed since the last tick
+            if self._dirty:
+                area.tag_redraw()
+                self._dirty = False
+            # Stop ticking once there is nothing left to animate
+            if not (self.is_transitioning or (self.mouse_down and self._coalesce)):
+                self._remove_timer(context)
             return {'RUNNING_MODAL'}
 
         # Exit conditions
         if (event.type in {'LEFT_ALT', 'RIGHT_ALT'} and event.value == 'RELEASE'):
             return self.finish(context)
 
-        # Determine the desired mode from modifier keys
-        desired_mode = None
-        if event.alt and event.ctrl and event.shift:
-            desired_mode = 'PAN'
-        elif event.alt and event.ctrl:
-            desired_mode = 'ORBIT'
-        elif event.alt:
-            desired_mode = 'FOCUS'
+        # Determine the desired mode from modifier keys, only when they change.
+        # Without Alt the mode is left unchanged, so Ctrl/Shift aren't read.
+        if event.alt:
+            mods = (event.ctrl << 1) | event.shift
+            if mods != self._last_mods:
+                self._last_mods = mods
+                desired_mode = self._MODE_TABLE[mods]
 
-        # If the mode has changed, update the state
-        if desired_mode and desired_mode != self.mode:
-            self._set_mode(context, desired_mode)
+                # If the mode has changed, update the state
+                if desired_mode != self.mode:
+                    self._set_mode(context, desired_mode)
 
         # --- Event Handling ---
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
             self.mouse_down = True
             self.last_x = event.mouse_region_x
             self.last_y = event.mouse_region_y
+            self._pending_dx = 0
+            self._pending_dy = 0
+            if self._coalesce:
+                self._ensure_timer(context)
             
             self._handle_click(context, event)
             return {'RUNNING_MODAL'}
@@ -298,103 +602,175 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         # Clear header text
         context.workspace.status_text_set(None)
         # Remove timer
-        if self._timer:
+        self._remove_timer(context)
+        return {'CANCELLED'}
+
+    def _ensure_timer(self, context):
+        """Start the animation timer if it isn't already running."""
+        if self._timer is None:
+            self._timer = context.window_manager.event_timer_add(0.016, window=context.window)  # ~60fps
+
+    def _remove_timer(self, context):
+        """Stop the animation timer if it is running."""
+        if self._timer is not None:
             context.window_manager.event_timer_remove(self._timer)
             self._timer = None
-        return {'CANCELLED'}
     
     def _start_transition(self, context, target_point):
         """Start smooth transition to look at target point."""
-        rv3d = context.space_data.region_3d
+        rv3d = self._rv3d
         
         # If there's no previous target, use the current view location as the start
         if self.target_point is None:
             self.target_point = rv3d.view_location.copy()
+        else:
+            # Once any transition has finished (or been settled by _set_mode),
+            # the view looks at the current target; during a transition
+            # target_point is the end target it is already heading to. If the
+            # new target is practically the same point, there is nothing to do.
+            tp = self.target_point
+            dx = target_point.x - tp.x
+            dy = target_point.y - tp.y
+            dz = target_point.z - tp.z
+            if dx * dx + dy * dy + dz * dz < 1e-6 * self.distance * self.distance:
+                # Fresh raycast result the caller doesn't keep; no copy needed
+                self.target_point = target_point
+                return
             
         self.start_target = self.target_point.copy()
 
         # In camera-lock mode, read current state from the camera object directly
         # since rv3d may not reflect our prior writes to matrix_world.
+        # view_mat is never modified in place, so referencing its translation
+        # is safe without another copy.
         view_mat = self._get_camera_matrix(context)
-        self.initial_cam_pos = view_mat.translation.copy()
-        if self.camera_lock_mode and context.scene.camera:
+        self.initial_cam_pos = view_mat.translation
+        if self.camera_lock_mode:
             self.start_rotation = view_mat.to_quaternion()
         else:
             self.start_rotation = rv3d.view_rotation.copy()
 
         # Calculate desired final state
-        direction = (target_point - self.initial_cam_pos).normalized()
-        self.end_rotation = direction.to_track_quat('-Z', 'Y')
-        self.end_target = target_point.copy()
+        self.end_rotation = _look_at_quaternion(self.initial_cam_pos, target_point)
+        # target_point is a fresh raycast result that the caller doesn't keep.
+        # self.target_point shares it below: panning modifies the target in
+        # place, but only outside transitions, once end_target is done with.
+        self.end_target = target_point
+        
+        self._onlerp_coeffs = _onlerp_coefficients(self.start_rotation, self.end_rotation)
+        # Target the view currently looks at, updated every transition tick
+        self._transition_target = self.start_target
+        # View distance at either end; interpolated instead of re-measured per tick
+        self._start_distance = (self.initial_cam_pos - self.start_target).length
+        self._end_distance = (self.initial_cam_pos - self.end_target).length
         
         # Start transition timer
+        self._ensure_timer(context)
         self.is_transitioning = True
-        self.transition_start_time = time.time() * 1000  # milliseconds
-        self.target_point = target_point.copy()
+        self.transition_start_time = _perf()  # seconds, monotonic
+        self.target_point = self.end_target
 
     def _update_transition(self, context):
         """Update smooth camera transition by interpolating rotation and target point."""
         if not self.is_transitioning:
             return
             
-        current_time = time.time() * 1000
-        elapsed = current_time - self.transition_start_time
+        elapsed = _perf() - self.transition_start_time
         progress = min(1.0, elapsed / self.transition_duration)
         
-        # Smooth easing
-        if progress < 0.5:
-            eased = 2 * progress * progress
-        else:
-            eased = 1 - pow(-2 * progress + 2, 2) / 2
+        # Smooth easing, interpolated from the precomputed table
+        eased = _eased_progress(progress)
         
         # Interpolate rotation and target point
-        current_rotation = self.start_rotation.slerp(self.end_rotation, eased)
+        current_rotation = _onlerp(self.start_rotation, self.end_rotation, eased, *self._onlerp_coeffs)
         current_target = self.start_target.lerp(self.end_target, eased)
+        self._transition_target = current_target
+        
+        self._request_redraw(context)
         
         # Update view to keep camera position fixed while rotating toward target
         if self.camera_lock_mode:
             self._apply_camera_transform(context, self.initial_cam_pos, current_rotation)
         else:
-            rv3d = context.space_data.region_3d
+            rv3d = self._rv3d
             rv3d.view_rotation = current_rotation
             rv3d.view_location = current_target
-            rv3d.view_distance = (self.initial_cam_pos - current_target).length
+            start_distance = self._start_distance
+            rv3d.view_distance = start_distance + (self._end_distance - start_distance) * eased
+            self._view_inv = None
+        self._pan_basis = None
         
         # Check if transition is complete
         if progress >= 1.0:
             self.is_transitioning = False
-            self.target_point = self.end_target.copy() # Lock in the final target
-            
-            # Recompute spherical coordinates from the final state
-            direction = (self.initial_cam_pos - self.target_point)
-            self.distance = direction.length
-            self._direction_to_spherical(direction)
+            self.target_point = self.end_target # Lock in the final target
+            self._update_spherical_from_camera()
+
+    def _settle_transition(self, context):
+        """Stop a running transition, keeping the view where it currently is.
+
+        Re-derives the target and spherical coordinates from the partly
+        rotated view so later drags and clicks start from what is on screen.
+        """
+        if not self.is_transitioning:
+            return
+        self.is_transitioning = False
+        self.target_point = self._transition_target.copy()
+        if not self.camera_lock_mode:
+            # The interpolated view distance means the viewport camera may have
+            # drifted slightly from initial_cam_pos. Rebuild its position from
+            # the values last written, since view_matrix only updates on redraw.
+            rv3d = self._rv3d
+            offset = rv3d.view_rotation @ Vector((0.0, 0.0, rv3d.view_distance))
+            self.initial_cam_pos = rv3d.view_location + offset
+        self._update_spherical_from_camera()
+
+    def _update_spherical_from_camera(self, _cart_to_spherical=_cart_to_spherical):
+        """Recompute spherical coordinates from the camera position and target.
+
+        The keyword default binds the hot global as a fast local; don't pass it.
+        """
+        cam = self.initial_cam_pos
+        tp = self.target_point
+        r, phi, theta = _cart_to_spherical(cam.x - tp.x, cam.y - tp.y, cam.z - tp.z)
+        if r > 0.0:
+            self._sph[:] = phi, theta, r
+        else:
+            self._sph[2] = r
     
     def _perform_raycast(self, context, event, coord_override=None):
         """Helper method to perform raycast and return result and location.
         
         :param coord_override: Optional (x, y) region-relative coordinates to
             raycast from instead of the event's current mouse position.
+            Coordinates outside the region are treated as a miss.
         """
-        region = context.region
-        rv3d = context.space_data.region_3d
+        region = self._region
+        rv3d = self._rv3d
         
         if coord_override is not None:
-            coord = (
-                coord_override[0] % region.width,
-                coord_override[1] % region.height
-            )
+            # The override is a real press position, not a wrapped grab
+            # coordinate, so outside the region there is nothing to hit.
+            x, y = coord_override
+            if not (0 <= x < region.width and 0 <= y < region.height):
+                return False, None
+            coord = (x, y)
         else:
-            coord = (
-                event.mouse_region_x % region.width,
-                event.mouse_region_y % region.height
-            )
+            # With GRAB_CURSOR the position can run past the region edges after
+            # the cursor wraps; map it back only in that case.
+            x = event.mouse_region_x
+            y = event.mouse_region_y
+            if x < 0 or x >= region.width:
+                x %= region.width
+            if y < 0 or y >= region.height:
+                y %= region.height
+            coord = (x, y)
         
         view_vec = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord)
         ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
         
-        result, location, normal, index, object, matrix = context.scene.ray_cast(
-            context.view_layer.depsgraph, ray_origin, view_vec)
+        result, location, normal, index, object, matrix = self._scene.ray_cast(
+            self._depsgraph, ray_origin, view_vec)
         
         return result, location
 
@@ -404,7 +780,7 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         
         if result:
             self._start_transition(context, location)
-            context.area.tag_redraw()
+            self._request_redraw(context)
             return True
         else:
             self.target_point = None
@@ -416,94 +792,136 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         
         if result:
             self._start_transition(context, location)
-            context.area.tag_redraw()
+            self._request_redraw(context)
             return True
         return False
 
     def _handle_focus_drag(self, context, dx, dy):
-        """Handle ALT+Drag - orbit horizontally and zoom with mouse movement"""
+        """Handle ALT+Drag - orbit horizontally and zoom with mouse movement.
+
+        Returns True if the view was updated.
+        """
         if not self.target_point:
-            return
+            return False
             
         # Apply axis inversion - horizontal orbiting and vertical zooming
-        theta_delta = dx if self.prefs.invert_horizontal else -dx
+        theta_delta = dx if self._inv_h else -dx
         zoom_delta = dy  # Zoom direction should not be affected by invert_vertical
         
+        sph = self._sph
+        
         # Update theta (horizontal orbiting)
-        self.theta += theta_delta * self.prefs.orbit_sensitivity
+        sph[1] += theta_delta * self._orbit_sens
+        changed = theta_delta != 0
         
         # Update distance (zooming)
         if zoom_delta != 0:
-            zoom_sensitivity = self.prefs.zoom_sensitivity
+            zoom_sensitivity = self._zoom_sens
             
             # Apply smooth distance-based zoom compensation
-            # Use a curve that provides fine control when close, normal control when far
-            base_factor = self.distance * 0.1
-            fine_control_factor = 0.01 + (base_factor - 0.01) * (self.distance / (self.distance + 0.5))
-            distance_factor = max(0.01, fine_control_factor)
+            # Use a curve that provides fine control when close, normal control when far.
+            # Folded form of 0.01 + (0.1*d - 0.01) * d / (d + 0.5).
+            d = sph[2]
+            distance_factor = (0.005 + 0.1 * d * d) / (d + 0.5)
+            if distance_factor < 0.01:
+                distance_factor = 0.01
             
             zoom_change = -zoom_delta * zoom_sensitivity * distance_factor
             
             # Apply distance limits
-            min_distance = self.prefs.min_zoom_distance
-            max_distance = self.prefs.max_zoom_distance
-            self.distance = max(min_distance, min(max_distance, self.distance + zoom_change))
+            new_distance = max(self._min_d, min(self._max_d, d + zoom_change))
+            sph[2] = new_distance
+            # Zooming against a distance limit leaves the view where it was
+            if abs(new_distance - d) > _EPSILON * d:
+                changed = True
         
         # Update camera position using spherical coordinates
-        self._update_camera_position(context)
+        if changed:
+            self._update_camera_position(context)
+        return changed
     
     def _handle_orbit_drag(self, context, dx, dy):
-        """Handle ALT+CTRL+Drag - orbit at constant distance with elevation limits"""
+        """Handle ALT+CTRL+Drag - orbit at constant distance with elevation limits.
+
+        Returns True if the view was updated.
+        """
         if not self.target_point:
-            return
+            return False
             
         # Apply axis inversion
-        theta_delta = dx if self.prefs.invert_horizontal else -dx
-        phi_delta = dy if self.prefs.invert_vertical else -dy
+        theta_delta = dx if self._inv_h else -dx
+        phi_delta = dy if self._inv_v else -dy
+        
+        sph = self._sph
         
         # Update theta (horizontal rotation)
-        self.theta += theta_delta * self.prefs.orbit_sensitivity
+        sph[1] += theta_delta * self._orbit_sens
         
         # Update phi (vertical rotation) with elevation limits
-        new_phi = self.phi - phi_delta * self.prefs.orbit_sensitivity
+        old_phi = sph[0]
+        new_phi = old_phi - phi_delta * self._orbit_sens
         # Clamp phi to prevent looking straight up or down, based on user preference
-        min_phi_from_pole = math.radians(90.0 - self.prefs.orbit_elevation_limit)
-        min_phi = min_phi_from_pole
-        max_phi = math.pi - min_phi_from_pole
-        self.phi = max(min_phi, min(max_phi, new_phi))
+        min_phi = self._min_phi
+        max_phi = self._max_phi
+        new_phi = min_phi if new_phi < min_phi else (max_phi if new_phi > max_phi else new_phi)
+        sph[0] = new_phi
+        
+        # Orbiting vertically against an elevation limit leaves the view where it was
+        changed = theta_delta != 0 or abs(new_phi - old_phi) > _EPSILON
         
         # Update camera position using spherical coordinates
-        self._update_camera_position(context)
+        if changed:
+            self._update_camera_position(context)
+        return changed
     
     def _handle_pan_drag(self, context, dx, dy):
-        """Handle ALT+CTRL+SHIFT+Drag - pan camera and target together"""
+        """Handle ALT+CTRL+SHIFT+Drag - pan camera and target together.
+
+        Returns True if the view was updated.
+        """
         # Apply axis inversion for pan mode
-        pan_dx = dx if self.prefs.invert_horizontal else -dx
-        pan_dy = dy if self.prefs.invert_vertical else -dy
+        pan_dx = dx if self._inv_h else -dx
+        pan_dy = dy if self._inv_v else -dy
         
         # Get camera's right and up vectors. In camera-lock mode, read from the
         # camera object since rv3d may not reflect our prior matrix_world writes.
+        # These are the first two columns of the camera's rotation. Panning
+        # never rotates the view, so they are kept until something else does.
         view_mat = self._get_camera_matrix(context)
-        right_vec = view_mat.to_3x3() @ Vector((1, 0, 0))
-        up_vec = view_mat.to_3x3() @ Vector((0, 1, 0))
+        basis = self._pan_basis
+        if basis is None:
+            right_vec = view_mat.col[0]
+            up_vec = view_mat.col[1]
+            basis = self._pan_basis = (
+                right_vec.x, right_vec.y, right_vec.z,
+                up_vec.x, up_vec.y, up_vec.z,
+            )
+        rx, ry, rz, ux, uy, uz = basis
         
         # Calculate pan sensitivity based on distance
-        base_sensitivity = self.prefs.pan_sensitivity
         distance_factor = max(0.01, self.distance)
-        sensitivity = base_sensitivity * distance_factor
+        sensitivity = self._pan_sens * distance_factor
+        
+        # Calculate pan vector component-wise into the scratch vector
+        h = pan_dx * sensitivity
+        v = pan_dy * sensitivity
+        pan_vec = self._scratch_pan
+        pan_vec.x = rx * h + ux * v
+        pan_vec.y = ry * h + uy * v
+        pan_vec.z = rz * h + uz * v
         
-        # Calculate pan vector
-        pan_vec = (right_vec * pan_dx + up_vec * pan_dy) * sensitivity
+        # Panning only translates the view, so the cached matrix can be carried
+        # over with the same offset instead of being inverted again.
+        mat = view_mat.copy()
+        mat.translation += pan_vec
+        self._view_inv = mat
         
         self.target_point += pan_vec
         if self.camera_lock_mode:
-            camera = context.scene.camera
-            if camera:
-                mat = camera.matrix_world.copy()
-                mat.translation += pan_vec
-                camera.matrix_world = mat
+            self._camera.matrix_world = mat
         else:
-            context.space_data.region_3d.view_location += pan_vec
+            self._rv3d.view_location += pan_vec
+        return True
 
     def _update_status_text(self, context):
         """Update status text based on current mode and target state."""
@@ -519,14 +937,20 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         if new_mode == self.mode:
             return
 
-        rv3d = context.space_data.region_3d
+        rv3d = self._rv3d
         self.mode = new_mode
-        self.is_transitioning = False  # Stop any transitions on mode change
+        self._settle_transition(context)  # Stop any transitions on mode change
+
+        # The pan axes are re-read from the view when a pan next starts
+        self._pan_basis = None
 
         if new_mode in ('ORBIT', 'PAN'):
             # Ensure we have a target point for orbit/pan modes
             if not self.target_point:
                 self.target_point = rv3d.view_location.copy()
+
+        # Pick up preference edits made while the operator was running
+        self._cache_prefs()
         
         # Update status text for the new mode
         self._update_status_text(context)
@@ -544,25 +968,59 @@ class SL_CAMERA_OT_modal(bpy.types.Operator):
         """
         Handles mouse drag operations.
         """
-        dx = event.mouse_region_x - self.last_x
-        dy = event.mouse_region_y - self.last_y
-
-        # If mouse is down, perform the drag action
-        if self.mouse_down and (dx != 0 or dy != 0):
-            if not self.is_transitioning:
-                if self.mode == 'FOCUS':
-                    self._handle_focus_drag(context, dx, dy)
-                elif self.mode == 'ORBIT':
-                    self._handle_orbit_drag(context, dx, dy)
-                elif self.mode == 'PAN':
-                    self._handle_pan_drag(context, dx, dy)
-                
-                context.area.tag_redraw()
+        x = event.mouse_region_x
+        y = event.mouse_region_y
+
+        # Hovering with the button up only needs to track the position
+        if not self.mouse_down:
+            self.last_x = x
+            self.last_y = y
+            return
+
+        dx = x - self.last_x
+        dy = y - self.last_y
 
         # Always update the last position for the next delta calculation
-        self.last_x = event.mouse_region_x
-        self.last_y = event.mouse_region_y
+        self.last_x = x
+        self.last_y = y
+
+        # Queue the movement for the next drag update.
+        # Movement during a transition is dropped to avoid view jerking.
+        if (dx != 0 or dy != 0) and not self.is_transitioning:
+            self._pending_dx += dx
+            self._pending_dy += dy
+            # When coalescing, the timer applies the queued movement instead
+            if not self._coalesce:
+                self._apply_pending_drag(context)
             
+    def _apply_pending_drag(self, context):
+        """Apply the mouse movement accumulated since the last drag update."""
+        dx = self._pending_dx
+        dy = self._pending_dy
+        # Keep accumulating until the movement passes the drag threshold
+        if dx * dx + dy * dy < self._drag_threshold_sq:
+            return
+        self._pending_dx = 0
+        self._pending_dy = 0
+
+        changed = False
+        if self.mode == 'FOCUS':
+            changed = self._handle_focus_drag(context, dx, dy)
+        elif self.mode == 'ORBIT':
+            changed = self._handle_orbit_drag(context, dx, dy)
+        elif self.mode == 'PAN':
+            changed = self._handle_pan_drag(context, dx, dy)
+
+        if changed:
+            self._request_redraw(context)
+
+    def _request_redraw(self, context):
+        """Tag the area for redraw, deferred to the next timer tick if the timer runs."""
+        if self._timer is None:
+            context.area.tag_redraw()
+        else:
+            self._dirty = True
+
 # --- register --------------------------------------------------------------
 def register():
     bpy.utils.register_class(SLCameraPreferences)
@@ -573,6 +1031,12 @@ def register():
     if kc:
         km = kc.keymaps.new(name='3D View', space_type='VIEW_3D')
 
+        # Drop entries left behind by an earlier registration (e.g. a script
+        # reload without unregister) so duplicates don't pile up.
+        stale = [kmi for kmi in km.keymap_items if kmi.idname == SL_CAMERA_OT_modal.bl_idname]
+        for kmi in stale:
+            km.keymap_items.remove(kmi)
+
         # ALT + CTRL + SHIFT = PAN mode
         kmi = km.keymap_items.new(
             'view3d.sl_camera_modal',